@@ -10,20 +10,21 @@ def main():
     print("🏆 AI Tournament: Random AI vs Smart AI")
     print("Running 10 games...")
     
+    # One game, interface and set of players shared by every round
+    game = TicTacToe()
+    interface = ConsoleInterface(game)
+    
+    # Create AI players
+    random_ai = RandomAI('X', f"Random AI")
+    smart_ai = SmartAI('O', f"Smart AI")
+    players = {'X': random_ai, 'O': smart_ai}
+    
     for i in range(10):
-        # Create new game for each round
-        game = TicTacToe()
-        interface = ConsoleInterface(game)
-        
-        # Create AI players
-        random_ai = RandomAI('X', f"Random AI")
-        smart_ai = SmartAI('O', f"Smart AI")
+        game.reset()
         
         print(f"\n--- Game {i+1} ---")
         
         # Play without showing board (silent mode)
-        players = {'X': random_ai, 'O': smart_ai}
-        
         while not game.is_game_over():
             current_player = players[game.current_player]
             move = current_player.get_move(game)
@@ -26,23 +26,46 @@ class TicTacToe:
         [0, 4, 8], [2, 4, 6]
     ]
     
+    # Bitmask form of WIN_PATTERNS (bit i set for board position i)
+    WIN_MASKS = (
+        0b000000111, 0b000111000, 0b111000000,
+        0b001001001, 0b010010010, 0b100100100,
+        0b100010001, 0b001010100
+    )
+    
+    # Indices into WIN_PATTERNS of the patterns passing through each position
+    CELL_TO_PATTERNS = (
+        (0, 3, 6), (0, 4), (0, 5, 7),
+        (1, 3), (1, 4, 6, 7), (1, 5),
+        (2, 3, 7), (2, 4), (2, 5, 6)
+    )
+    
+    FULL_MASK = 0x1FF
+    
+    # Player to move, indexed by moves_count parity (X always starts)
+    _PLAYERS = ('X', 'O')
+    
     def __init__(self):
         """Initialize a new tic-tac-toe game."""
-        self.board = [' '] * 9
+        self.x_mask = 0
+        self.o_mask = 0
         self.current_player = 'X'
         self.game_state = GameState.ONGOING
         self.moves_count = 0
         self.winner = None
         self.winning_pattern = None
+        self._avail_cache: Optional[Tuple[int, ...]] = None
     
     def reset(self):
         """Reset the game to initial state."""
-        self.board = [' '] * 9
+        self.x_mask = 0
+        self.o_mask = 0
         self.current_player = 'X'
         self.game_state = GameState.ONGOING
         self.moves_count = 0
         self.winner = None
         self.winning_pattern = None
+        self._avail_cache = None
     
     def make_move(self, position: int) -> bool:
         """
@@ -57,15 +80,19 @@ class TicTacToe:
         if not self.is_valid_move(position):
             return False
         
-        self.board[position] = self.current_player
+        if self.current_player == 'X':
+            self.x_mask |= 1 << position
+        else:
+            self.o_mask |= 1 << position
         self.moves_count += 1
+        self._avail_cache = None
         
         # Check for win or draw
-        self._update_game_state()
+        self._update_game_state(position)
         
         # Switch player if game is still ongoing
         if self.game_state == GameState.ONGOING:
-            self.current_player = 'O' if self.current_player == 'X' else 'X'
+            self.current_player = self._PLAYERS[self.moves_count & 1]
         
         return True
     
@@ -81,27 +108,39 @@ class TicTacToe:
         """
         return (
             0 <= position <= 8 and 
-            self.board[position] == ' ' and 
+            not ((self.x_mask | self.o_mask) >> position) & 1 and 
             self.game_state == GameState.ONGOING
         )
     
-    def get_available_moves(self) -> List[int]:
+    def get_available_moves(self) -> Tuple[int, ...]:
         """
-        Get list of available move positions.
+        Get available move positions.
+        
+        The result is cached until the next move, so it is returned as
+        an immutable tuple.
         
         Returns:
-            List[int]: Available positions
+            Tuple[int, ...]: Available positions
         """
-        return [i for i in range(9) if self.board[i] == ' ']
+        if self._avail_cache is None:
+            free_mask = ~(self.x_mask | self.o_mask) & self.FULL_MASK
+            self._avail_cache = tuple(i for i in range(9) if (free_mask >> i) & 1)
+        return self._avail_cache
     
-    def _update_game_state(self):
-        """Update the game state after a move."""
-        # Check for win
-        for pattern in self.WIN_PATTERNS:
-            if (self.board[pattern[0]] == self.board[pattern[1]] == 
-                self.board[pattern[2]] != ' '):
-                self.winner = self.board[pattern[0]]
-                self.winning_pattern = pattern
+    def _update_game_state(self, last_position: int):
+        """
+        Update the game state after a move.
+        
+        Args:
+            last_position: Position just played by the current player
+        """
+        # Check for win; only patterns through the new mark can have completed
+        player_mask = self.x_mask if self.current_player == 'X' else self.o_mask
+        for pattern_index in self.CELL_TO_PATTERNS[last_position]:
+            win_mask = self.WIN_MASKS[pattern_index]
+            if player_mask & win_mask == win_mask:
+                self.winner = self.current_player
+                self.winning_pattern = self.WIN_PATTERNS[pattern_index]
                 self.game_state = (GameState.X_WINS if self.winner == 'X' 
                                  else GameState.O_WINS)
                 return
@@ -114,16 +153,26 @@ class TicTacToe:
         """Check if the game is over."""
         return self.game_state != GameState.ONGOING
     
+    @property
+    def board(self) -> List[str]:
+        """Board as a list of symbols, rebuilt from the bitboards."""
+        return [
+            'X' if (self.x_mask >> i) & 1 else
+            'O' if (self.o_mask >> i) & 1 else ' '
+            for i in range(9)
+        ]
+    
     def get_board_copy(self) -> List[str]:
         """Get a copy of the current board state."""
-        return self.board.copy()
+        return self.board
     
     def __str__(self) -> str:
         """String representation of the board."""
-        board_str = ""
-        for i in range(0, 9, 3):
-            row = " | ".join(self.board[i:i+3])
-            board_str += row + "\n"
-            if i < 6:
-                board_str += "---------\n"
-        return board_str
\ No newline at end of file
+        b = self.board
+        return (
+            f"{b[0]} | {b[1]} | {b[2]}\n"
+            "---------\n"
+            f"{b[3]} | {b[4]} | {b[5]}\n"
+            "---------\n"
+            f"{b[6]} | {b[7]} | {b[8]}\n"
+        )
\ No newline at end of file
@@ -23,19 +23,19 @@ class ConsoleInterface:
     
     def display_board(self):
         """Display the current board state."""
-        print("\nCurrent Board:")
-        print("   1 | 2 | 3 ")
-        print("  -----------")
-        
-        board = self.game.get_board_copy()
-        for i in range(0, 9, 3):
-            row_nums = f" {i//3 + 1} "
-            row_content = " | ".join([cell if cell != ' ' else str(i + j + 1) 
-                                    for j, cell in enumerate(board[i:i+3])])
-            print(f"{row_nums}{row_content}")
-            if i < 6:
-                print("  -----------")
-        print()
+        # Empty cells show their 1-9 position number
+        b = [cell if cell != ' ' else str(i + 1) 
+             for i, cell in enumerate(self.game.get_board_copy())]
+        print(
+            "\nCurrent Board:\n"
+            "   1 | 2 | 3 \n"
+            "  -----------\n"
+            f" 1 {b[0]} | {b[1]} | {b[2]}\n"
+            "  -----------\n"
+            f" 2 {b[3]} | {b[4]} | {b[5]}\n"
+            "  -----------\n"
+            f" 3 {b[6]} | {b[7]} | {b[8]}\n"
+        )
     
     def display_result(self):
         """Display the game result."""
@@ -4,10 +4,27 @@ Player implementations for tic-tac-toe games.
 
 import random
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from .game import TicTacToe
 
-if TYPE_CHECKING:
-    from .game import TicTacToe
+# Transposition table entry bounds
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+@lru_cache(maxsize=None)
+def _has_win(mask: int) -> bool:
+    """Check whether a bitboard contains a complete win pattern."""
+    # TicTacToe.WIN_MASKS unrolled, so no loop or attribute lookups per call
+    return (
+        mask & 0b000000111 == 0b000000111 or
+        mask & 0b000111000 == 0b000111000 or
+        mask & 0b111000000 == 0b111000000 or
+        mask & 0b001001001 == 0b001001001 or
+        mask & 0b010010010 == 0b010010010 or
+        mask & 0b100100100 == 0b100100100 or
+        mask & 0b100010001 == 0b100010001 or
+        mask & 0b001010100 == 0b001010100
+    )
 
 class Player(ABC):
     """Abstract base class for all player types."""
@@ -59,16 +76,66 @@ class RandomAI(Player):
     
     def get_move(self, game: 'TicTacToe') -> int:
         """Get a random valid move."""
-        available_moves = game.get_available_moves()
-        return random.choice(available_moves)
+        occupied = game.x_mask | game.o_mask
+        if occupied == TicTacToe.FULL_MASK:
+            raise IndexError("No available moves")
+        
+        # Draw 4 random bits until they name a free square; uniform over free squares
+        while True:
+            position = random.getrandbits(4)
+            if position < 9 and not (occupied >> position) & 1:
+                return position
 
 class SmartAI(Player):
     """AI player that uses minimax algorithm."""
     
+    # Center, then corners, then edges: strongest moves first for more cut-offs
+    _MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+    
+    # (x_mask, o_mask, symbol to move) -> minimax move, shared by all instances
+    _BEST_MOVE_TABLE: Optional[Dict[Tuple[int, int, str], int]] = None
+    
     def __init__(self, symbol: str, name: str = "", difficulty: str = "hard"):
         super().__init__(symbol, name or f"Smart AI ({symbol})")
         self.difficulty = difficulty
         self.opponent_symbol = 'O' if symbol == 'X' else 'X'
+        # Transposition table: (my_mask, opp_mask, is_maximizing) -> (score, move, bound).
+        # Kept for the lifetime of the player so later moves reuse earlier searches.
+        self._tt: Dict[Tuple[int, int, bool], Tuple[int, Optional[int], int]] = {}
+        
+        if SmartAI._BEST_MOVE_TABLE is None:
+            # Set before building: the build creates SmartAI searchers itself
+            SmartAI._BEST_MOVE_TABLE = {}
+            self._build_move_table(SmartAI._BEST_MOVE_TABLE)
+    
+    @staticmethod
+    def _build_move_table(table: Dict[Tuple[int, int, str], int]):
+        """
+        Fill the table with the minimax move for every reachable position.
+        
+        Args:
+            table: Dictionary to fill, keyed by (x_mask, o_mask, symbol to move)
+        """
+        searchers = {'X': SmartAI('X'), 'O': SmartAI('O')}
+        stack = [(0, 0, 'X')]
+        while stack:
+            x_mask, o_mask, player = stack.pop()
+            key = (x_mask, o_mask, player)
+            my_mask, opp_mask = (x_mask, o_mask) if player == 'X' else (o_mask, x_mask)
+            searcher = searchers[player]
+            occupied = x_mask | o_mask
+            if (key in table or occupied == TicTacToe.FULL_MASK or
+                    searcher._evaluate_board(my_mask, opp_mask) != 0):
+                continue
+            
+            _, table[key] = searcher._minimax(my_mask, opp_mask, True, -1000, 1000)
+            for i in range(9):
+                bit = 1 << i
+                if not occupied & bit:
+                    if player == 'X':
+                        stack.append((x_mask | bit, o_mask, 'O'))
+                    else:
+                        stack.append((x_mask, o_mask | bit, 'X'))
     
     def get_move(self, game: 'TicTacToe') -> int:
         """Get the best move using minimax algorithm."""
@@ -77,65 +144,111 @@ class SmartAI(Player):
             if random.random() < 0.3:
                 return random.choice(game.get_available_moves())
         
-        _, best_move = self._minimax(game.get_board_copy(), self.symbol, True)
+        best_move = self._BEST_MOVE_TABLE.get((game.x_mask, game.o_mask, self.symbol))
+        if best_move is not None:
+            return best_move
+        
+        # Position not reachable in normal play (e.g. playing out of turn)
+        if self.symbol == 'X':
+            my_mask, opp_mask = game.x_mask, game.o_mask
+        else:
+            my_mask, opp_mask = game.o_mask, game.x_mask
+        _, best_move = self._minimax(my_mask, opp_mask, True, -1000, 1000)
         return best_move if best_move is not None else game.get_available_moves()[0]
     
-    def _minimax(self, board: list, player: str, is_maximizing: bool) -> tuple:
+    def _minimax(self, my_mask: int, opp_mask: int, is_maximizing: bool,
+                 alpha: int = -1000, beta: int = 1000) -> tuple:
         """
-        Minimax algorithm implementation.
+        Minimax algorithm implementation with alpha-beta pruning.
+        
+        Args:
+            my_mask: Bitboard of this AI's positions
+            opp_mask: Bitboard of the opponent's positions
+            is_maximizing: True if it is this AI's turn
+            alpha: Best score the maximizing side can already guarantee
+            beta: Best score the minimizing side can already guarantee
+        
+        Scores are -10, 0 or 10, so +/-1000 serve as integer infinities.
         
         Returns:
             tuple: (score, best_move)
         """
-        # Check terminal states
-        score = self._evaluate_board(board)
-        if score != 0 or ' ' not in board:
-            return score, None
+        key = (my_mask, opp_mask, is_maximizing)
+        entry = self._tt.get(key)
+        pv_move = None
+        if entry is not None:
+            score, pv_move, bound = entry
+            if (bound == _EXACT or
+                    (bound == _LOWER and score >= beta) or
+                    (bound == _UPPER and score <= alpha)):
+                return score, pv_move
+        
+        # Check terminal states; only the side that just moved can have won
+        if is_maximizing:
+            if _has_win(opp_mask):
+                return -10, None
+        elif _has_win(my_mask):
+            return 10, None
+        occupied = my_mask | opp_mask
+        if occupied == TicTacToe.FULL_MASK:
+            return 0, None
+        
+        # Try the best move from an earlier search of this position first
+        if pv_move is None:
+            move_order = self._MOVE_ORDER
+        else:
+            move_order = (pv_move,) + self._MOVE_ORDER
         
+        alpha_start, beta_start = alpha, beta
+        searched = occupied
         best_move = None
         if is_maximizing:
-            best_score = float('-inf')
-            for i in range(9):
-                if board[i] == ' ':
-                    board[i] = player
+            best_score = -1000
+            for i in move_order:
+                bit = 1 << i
+                if not searched & bit:
+                    searched |= bit
                     current_score, _ = self._minimax(
-                        board, 
-                        self.opponent_symbol if player == self.symbol else self.symbol, 
-                        False
+                        my_mask | bit, opp_mask, False, alpha, beta
                     )
-                    board[i] = ' '  # Undo move
                     
                     if current_score > best_score:
                         best_score = current_score
                         best_move = i
-            return best_score, best_move
+                    alpha = max(alpha, best_score)
+                    if beta <= alpha:
+                        break  # Minimizing side will never allow this line
         else:
-            best_score = float('inf')
-            for i in range(9):
-                if board[i] == ' ':
-                    board[i] = player
+            best_score = 1000
+            for i in move_order:
+                bit = 1 << i
+                if not searched & bit:
+                    searched |= bit
                     current_score, _ = self._minimax(
-                        board, 
-                        self.opponent_symbol if player == self.symbol else self.symbol, 
-                        True
+                        my_mask, opp_mask | bit, True, alpha, beta
                     )
-                    board[i] = ' '  # Undo move
                     
                     if current_score < best_score:
                         best_score = current_score
                         best_move = i
-            return best_score, best_move
+                    beta = min(beta, best_score)
+                    if beta <= alpha:
+                        break  # Maximizing side will never allow this line
+        
+        # A score outside the original window is only a bound on the true value
+        if best_score <= alpha_start:
+            bound = _UPPER
+        elif best_score >= beta_start:
+            bound = _LOWER
+        else:
+            bound = _EXACT
+        self._tt[key] = (best_score, best_move, bound)
+        return best_score, best_move
     
-    def _evaluate_board(self, board: list) -> int:
+    def _evaluate_board(self, my_mask: int, opp_mask: int) -> int:
         """Evaluate the board position."""
-        from .game import TicTacToe
-        
-        # Check all win patterns
-        for pattern in TicTacToe.WIN_PATTERNS:
-            if (board[pattern[0]] == board[pattern[1]] == board[pattern[2]] != ' '):
-                winner = board[pattern[0]]
-                if winner == self.symbol:
-                    return 10
-                else:
-                    return -10
+        if _has_win(my_mask):
+            return 10
+        if _has_win(opp_mask):
+            return -10
         return 0  # No winner
\ No newline at end of file
@@ -3,7 +3,6 @@ Utility functions and classes for tic-tac-toe games.
 """
 
 from typing import Dict, List
-from collections import defaultdict
 from .game import GameState
 
 class GameStats:
@@ -12,7 +11,8 @@ class GameStats:
     def __init__(self):
         """Initialize game statistics."""
         self.games_played = 0
-        self.wins = defaultdict(int)
+        self.x_wins = 0
+        self.o_wins = 0
         self.draws = 0
         self.total_moves = 0
     
@@ -28,9 +28,9 @@ class GameStats:
         self.total_moves += total_moves
         
         if game_state == GameState.X_WINS:
-            self.wins['X'] += 1
+            self.x_wins += 1
         elif game_state == GameState.O_WINS:
-            self.wins['O'] += 1
+            self.o_wins += 1
         elif game_state == GameState.DRAW:
             self.draws += 1
     
@@ -38,8 +38,8 @@ class GameStats:
         """Get current statistics."""
         return {
             'games_played': self.games_played,
-            'x_wins': self.wins['X'],
-            'o_wins': self.wins['O'],
+            'x_wins': self.x_wins,
+            'o_wins': self.o_wins,
             'draws': self.draws,
             'average_moves': round(self.total_moves / max(1, self.games_played), 1)
         }
@@ -57,7 +57,8 @@ class GameStats:
     def reset(self):
         """Reset all statistics."""
         self.games_played = 0
-        self.wins.clear()
+        self.x_wins = 0
+        self.o_wins = 0
         self.draws = 0
         self.total_moves = 0
 